@@ -0,0 +1,57 @@
+"""
+JWT authentication backed by a short-lived user cache.
+"""
+
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+
+# Seconds a resolved user stays cached between database lookups
+USER_CACHE_TIMEOUT = 60
+
+
+def get_user_cache_key(user_id):
+    """Build the cache key for an authenticated user."""
+    return f'jwt_user:{user_id}'
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that caches the user looked up from the token.
+    
+    Only enabled when a shared cache (Redis) is configured, so that the
+    save/delete invalidation in accounts.signals reaches every worker.
+    Inactive or missing users are rejected exactly as before and never
+    cached. Users are loaded without the password hash, which is fetched
+    lazily by the few code paths that need it. QuerySet.update() bypasses
+    the signals, so such changes apply after USER_CACHE_TIMEOUT at most.
+    """
+    
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        # Token revocation checks compare against the password hash
+        if user_id is None or api_settings.CHECK_REVOKE_TOKEN:
+            return super().get_user(validated_token)
+        
+        cache_key = get_user_cache_key(user_id)
+        user = cache.get(cache_key)
+        if user is None:
+            user = self.get_uncached_user(user_id)
+            cache.set(cache_key, user, USER_CACHE_TIMEOUT)
+        return user
+    
+    def get_uncached_user(self, user_id):
+        """Load and validate the user like SimpleJWT, deferring the password."""
+        try:
+            user = self.user_model.objects.defer('password').get(
+                **{api_settings.USER_ID_FIELD: user_id}
+            )
+        except self.user_model.DoesNotExist as e:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found") from e
+        
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        
+        return user
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-15 21:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='role',
+            field=models.CharField(choices=[('user', 'User'), ('admin', 'Admin')], db_index=True, default='user', help_text='User role for access control', max_length=10),
+        ),
+    ]
@@ -25,6 +25,7 @@ class User(AbstractUser):
         max_length=10,
         choices=ROLE_CHOICES,
         default='user',
+        db_index=True,
         help_text="User role for access control"
     )
     created_at = models.DateTimeField(auto_now_add=True)
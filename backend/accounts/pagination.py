@@ -0,0 +1,14 @@
+"""
+Pagination classes for user management endpoints.
+"""
+
+from rest_framework.pagination import PageNumberPagination
+
+
+class AdminUserPagination(PageNumberPagination):
+    """
+    Page-number pagination for the admin user list.
+    """
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
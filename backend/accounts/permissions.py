@@ -5,6 +5,54 @@ Custom permissions for role-based access control.
 from rest_framework import permissions
 
 
+def get_request_role(request):
+    """
+    Resolve the requesting user's role once and cache it on the request.
+    
+    The role is read from the authenticated user rather than the JWT
+    ``role`` claim, so a demoted admin loses access immediately instead
+    of keeping it for the lifetime of their access token.
+    """
+    role = getattr(request, '_cached_role', None)
+    if role is None:
+        role = getattr(request.user, 'role', None)
+        request._cached_role = role
+    return role
+
+
+# Model class -> attribute holding the owner's primary key (None if unowned)
+_OWNER_FIELD_CACHE = {}
+
+
+def _owner_attr(obj):
+    """Return the owner foreign key attribute for obj's model, cached per class."""
+    cls = type(obj)
+    try:
+        return _OWNER_FIELD_CACHE[cls]
+    except KeyError:
+        pass
+    
+    attr = None
+    meta = getattr(cls, '_meta', None)
+    if meta is not None:
+        fields = {f.name: f for f in meta.concrete_fields if f.is_relation}
+        for name in ('owner', 'user'):
+            if name in fields:
+                attr = fields[name].attname
+                break
+    
+    _OWNER_FIELD_CACHE[cls] = attr
+    return attr
+
+
+def is_owner(obj, user):
+    """Check whether user owns obj, comparing keys without loading the owner."""
+    attr = _owner_attr(obj)
+    if attr is None:
+        return obj == user
+    return getattr(obj, attr) == user.pk
+
+
 class IsAdminUser(permissions.BasePermission):
     """
     Permission class that only allows admin users.
@@ -15,7 +63,7 @@ class IsAdminUser(permissions.BasePermission):
         return (
             request.user and 
             request.user.is_authenticated and 
-            request.user.role == 'admin'
+            get_request_role(request) == 'admin'
         )
 
 
@@ -27,16 +75,11 @@ class IsOwnerOrAdmin(permissions.BasePermission):
     
     def has_object_permission(self, request, view, obj):
         # Admin can access everything
-        if request.user.role == 'admin':
+        if get_request_role(request) == 'admin':
             return True
         
         # Check if the user is the owner
-        if hasattr(obj, 'owner'):
-            return obj.owner == request.user
-        if hasattr(obj, 'user'):
-            return obj.user == request.user
-        
-        return obj == request.user
+        return is_owner(obj, request.user)
 
 
 class IsOwner(permissions.BasePermission):
@@ -46,11 +89,7 @@ class IsOwner(permissions.BasePermission):
     message = "You can only access your own resources."
     
     def has_object_permission(self, request, view, obj):
-        if hasattr(obj, 'owner'):
-            return obj.owner == request.user
-        if hasattr(obj, 'user'):
-            return obj.user == request.user
-        return obj == request.user
+        return is_owner(obj, request.user)
 
 
 class ReadOnly(permissions.BasePermission):
@@ -2,14 +2,55 @@
 Serializers for User authentication and management.
 """
 
+import re
+
 from rest_framework import serializers
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from django.contrib.auth.password_validation import validate_password
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
 
+# Resolved once at import time; avoid calling get_user_model() inside methods
 User = get_user_model()
 
+_USERNAME_RE = re.compile(r'[A-Za-z0-9]{3,}')
+
+# Unique constraint on the users table -> registration field it protects
+_UNIQUE_CONSTRAINT_FIELDS = {
+    'users_email_key': 'email',
+    'users_username_key': 'username',
+}
+
+# Constraint or column named in the first line of a backend's error message
+_UNIQUE_VIOLATION_RE = re.compile(
+    r'unique constraint "(?P<constraint>\w+)"|UNIQUE constraint failed: users\.(?P<column>\w+)'
+)
+
+_DUPLICATE_MESSAGES = {
+    'email': "A user with this email already exists.",
+    'username': "A user with this username already exists.",
+}
+
+
+def get_unique_violation_field(error):
+    """
+    Return the registration field whose unique constraint an IntegrityError
+    violated, or None if it is not a recognised uniqueness error.
+    """
+    diag = getattr(error.__cause__, 'diag', None)
+    constraint = getattr(diag, 'constraint_name', None)
+    if constraint:
+        return _UNIQUE_CONSTRAINT_FIELDS.get(constraint)
+    
+    # Only the first line: PostgreSQL's DETAIL line echoes the submitted values
+    match = _UNIQUE_VIOLATION_RE.search(str(error).partition('\n')[0])
+    if match is None:
+        return None
+    if match['constraint']:
+        return _UNIQUE_CONSTRAINT_FIELDS.get(match['constraint'])
+    return match['column'] if match['column'] in _DUPLICATE_MESSAGES else None
+
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
     """
@@ -31,27 +72,24 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ['id', 'email', 'username', 'password', 'password_confirm', 'first_name', 'last_name']
+        # Uniqueness is enforced by the database constraints in create()
         extra_kwargs = {
-            'email': {'required': True},
-            'username': {'required': True},
+            'email': {'required': True, 'validators': []},
+            'username': {'required': True, 'validators': []},
             'first_name': {'required': False},
             'last_name': {'required': False},
         }
     
     def validate_email(self, value):
-        """Validate email is unique and properly formatted."""
-        if User.objects.filter(email=value.lower()).exists():
-            raise serializers.ValidationError("A user with this email already exists.")
+        """Normalize email to lowercase."""
         return value.lower()
     
     def validate_username(self, value):
-        """Validate username is unique and alphanumeric."""
-        if User.objects.filter(username=value.lower()).exists():
-            raise serializers.ValidationError("A user with this username already exists.")
-        if not value.isalnum():
+        """Validate username is alphanumeric."""
+        if not _USERNAME_RE.fullmatch(value):
+            if value.isascii() and value.isalnum():
+                raise serializers.ValidationError("Username must be at least 3 characters long.")
             raise serializers.ValidationError("Username must be alphanumeric.")
-        if len(value) < 3:
-            raise serializers.ValidationError("Username must be at least 3 characters long.")
         return value.lower()
     
     def validate_password(self, value):
@@ -74,14 +112,21 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         """Create a new user with hashed password."""
         validated_data.pop('password_confirm')
         
-        user = User.objects.create_user(
-            email=validated_data['email'],
-            username=validated_data['username'],
-            password=validated_data['password'],
-            first_name=validated_data.get('first_name', ''),
-            last_name=validated_data.get('last_name', ''),
-            role='user'  # Default role
-        )
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    email=validated_data['email'],
+                    username=validated_data['username'],
+                    password=validated_data['password'],
+                    first_name=validated_data.get('first_name', ''),
+                    last_name=validated_data.get('last_name', ''),
+                    role='user'  # Default role
+                )
+        except IntegrityError as e:
+            field = get_unique_violation_field(e)
+            if field is None:
+                raise
+            raise serializers.ValidationError({field: [_DUPLICATE_MESSAGES[field]]})
         return user
 
 
@@ -104,14 +149,15 @@ class UserLoginSerializer(TokenObtainPairSerializer):
     def validate(self, attrs):
         data = super().validate(attrs)
         
-        # Add user info to response
+        # Add user info to response from the already-loaded user instance
+        user = self.user
         data['user'] = {
-            'id': self.user.id,
-            'email': self.user.email,
-            'username': self.user.username,
-            'role': self.user.role,
-            'first_name': self.user.first_name,
-            'last_name': self.user.last_name,
+            'id': user.id,
+            'email': user.email,
+            'username': user.username,
+            'role': user.role,
+            'first_name': user.first_name,
+            'last_name': user.last_name,
         }
         
         return data
@@ -132,16 +178,12 @@ class UserListSerializer(serializers.ModelSerializer):
     """
     Serializer for listing users (admin only).
     """
-    tasks_count = serializers.SerializerMethodField()
+    tasks_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = User
         fields = ['id', 'email', 'username', 'first_name', 'last_name', 'role', 'is_active', 'created_at', 'tasks_count']
         read_only_fields = fields
-    
-    def get_tasks_count(self, obj):
-        """Get count of tasks owned by user."""
-        return obj.tasks.count() if hasattr(obj, 'tasks') else 0
 
 
 class ChangePasswordSerializer(serializers.Serializer):
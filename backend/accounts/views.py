@@ -2,15 +2,20 @@
 Views for user authentication and management.
 """
 
-from rest_framework import generics, status, views
+import logging
+import threading
+
+from rest_framework import generics, serializers, status, views
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth import get_user_model
-from drf_yasg.utils import swagger_auto_schema
+from django.db import connection
+from django.db.models import Count
 from drf_yasg import openapi
 
+from config.swagger import maybe_swagger
 from .serializers import (
     UserRegistrationSerializer,
     UserLoginSerializer,
@@ -20,9 +25,25 @@ from .serializers import (
     AdminUserUpdateSerializer,
 )
 from .permissions import IsAdminUser
+from .pagination import AdminUserPagination
+from tasks.cache import invalidate_stats_cache
 
+# Resolved once at import time; avoid calling get_user_model() inside methods
 User = get_user_model()
 
+logger = logging.getLogger(__name__)
+
+
+def blacklist_refresh_token(token):
+    """Blacklist a refresh token outside the request/response cycle."""
+    try:
+        token.blacklist()
+    except Exception:
+        logger.exception("Failed to blacklist refresh token")
+    finally:
+        # Worker threads open their own connection; don't leak it
+        connection.close()
+
 
 class UserRegistrationView(generics.CreateAPIView):
     """
@@ -35,7 +56,7 @@ class UserRegistrationView(generics.CreateAPIView):
     permission_classes = [AllowAny]
     serializer_class = UserRegistrationSerializer
     
-    @swagger_auto_schema(
+    @maybe_swagger(
         operation_description="Register a new user account",
         responses={
             201: openapi.Response(
@@ -64,10 +85,19 @@ class UserRegistrationView(generics.CreateAPIView):
     def post(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         if serializer.is_valid():
-            user = serializer.save()
+            try:
+                user = serializer.save()
+            except serializers.ValidationError as e:
+                # Duplicate email/username reported by the database
+                return Response({
+                    'success': False,
+                    'message': 'Registration failed',
+                    'errors': e.detail
+                }, status=status.HTTP_400_BAD_REQUEST)
             
-            # Generate JWT tokens
-            refresh = RefreshToken.for_user(user)
+            # Generate JWT tokens carrying the same custom claims as login
+            refresh = UserLoginSerializer.get_token(user)
+            access_token = refresh.access_token
             
             return Response({
                 'success': True,
@@ -80,7 +110,7 @@ class UserRegistrationView(generics.CreateAPIView):
                         'role': user.role,
                     },
                     'tokens': {
-                        'access': str(refresh.access_token),
+                        'access': str(access_token),
                         'refresh': str(refresh),
                     }
                 }
@@ -102,7 +132,7 @@ class UserLoginView(TokenObtainPairView):
     permission_classes = [AllowAny]
     serializer_class = UserLoginSerializer
     
-    @swagger_auto_schema(
+    @maybe_swagger(
         operation_description="Login to get JWT tokens",
         request_body=openapi.Schema(
             type=openapi.TYPE_OBJECT,
@@ -142,7 +172,7 @@ class TokenRefreshAPIView(TokenRefreshView):
     Returns a new access token (and optionally a new refresh token).
     """
     
-    @swagger_auto_schema(
+    @maybe_swagger(
         operation_description="Refresh access token",
         request_body=openapi.Schema(
             type=openapi.TYPE_OBJECT,
@@ -171,10 +201,13 @@ class TokenRefreshAPIView(TokenRefreshView):
 class LogoutView(views.APIView):
     """
     Logout by blacklisting the refresh token.
+    
+    The token is validated inline; the blacklist writes happen in a
+    background thread so the response is returned immediately.
     """
     permission_classes = [IsAuthenticated]
     
-    @swagger_auto_schema(
+    @maybe_swagger(
         operation_description="Logout and invalidate refresh token",
         request_body=openapi.Schema(
             type=openapi.TYPE_OBJECT,
@@ -184,7 +217,7 @@ class LogoutView(views.APIView):
             }
         ),
         responses={
-            200: "Successfully logged out",
+            202: "Logout accepted, refresh token will be blacklisted",
             400: "Bad Request"
         }
     )
@@ -198,12 +231,13 @@ class LogoutView(views.APIView):
                 }, status=status.HTTP_400_BAD_REQUEST)
             
             token = RefreshToken(refresh_token)
-            token.blacklist()
+            # Non-daemon, so a graceful worker shutdown waits for the write
+            threading.Thread(target=blacklist_refresh_token, args=(token,)).start()
             
             return Response({
                 'success': True,
                 'message': 'Successfully logged out'
-            }, status=status.HTTP_200_OK)
+            }, status=status.HTTP_202_ACCEPTED)
         
         except Exception as e:
             return Response({
@@ -222,7 +256,7 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
     def get_object(self):
         return self.request.user
     
-    @swagger_auto_schema(
+    @maybe_swagger(
         operation_description="Get current user's profile",
         responses={
             200: UserProfileSerializer
@@ -231,7 +265,7 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
     
-    @swagger_auto_schema(
+    @maybe_swagger(
         operation_description="Update current user's profile",
         responses={
             200: UserProfileSerializer
@@ -240,7 +274,7 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
     def put(self, request, *args, **kwargs):
         return super().put(request, *args, **kwargs)
     
-    @swagger_auto_schema(
+    @maybe_swagger(
         operation_description="Partially update current user's profile",
         responses={
             200: UserProfileSerializer
@@ -260,7 +294,7 @@ class ChangePasswordView(generics.UpdateAPIView):
     def get_object(self):
         return self.request.user
     
-    @swagger_auto_schema(
+    @maybe_swagger(
         operation_description="Change password",
         responses={
             200: "Password changed successfully",
@@ -294,8 +328,21 @@ class AdminUserListView(generics.ListAPIView):
     queryset = User.objects.all()
     permission_classes = [IsAuthenticated, IsAdminUser]
     serializer_class = UserListSerializer
+    pagination_class = AdminUserPagination
     
-    @swagger_auto_schema(
+    def get_queryset(self):
+        """Annotate task counts in a single grouped query."""
+        return (
+            super().get_queryset()
+            .only(
+                'id', 'email', 'username', 'first_name', 'last_name',
+                'role', 'is_active', 'created_at',
+            )
+            .annotate(tasks_count=Count('tasks'))
+            .order_by('-created_at')
+        )
+    
+    @maybe_swagger(
         operation_description="List all users (Admin only)",
         responses={
             200: UserListSerializer(many=True),
@@ -314,7 +361,7 @@ class AdminUserDetailView(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAuthenticated, IsAdminUser]
     serializer_class = AdminUserUpdateSerializer
     
-    @swagger_auto_schema(
+    @maybe_swagger(
         operation_description="Get user details (Admin only)",
         responses={
             200: AdminUserUpdateSerializer,
@@ -325,7 +372,7 @@ class AdminUserDetailView(generics.RetrieveUpdateDestroyAPIView):
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
     
-    @swagger_auto_schema(
+    @maybe_swagger(
         operation_description="Update user (Admin only)",
         responses={
             200: AdminUserUpdateSerializer,
@@ -336,7 +383,7 @@ class AdminUserDetailView(generics.RetrieveUpdateDestroyAPIView):
     def put(self, request, *args, **kwargs):
         return super().put(request, *args, **kwargs)
     
-    @swagger_auto_schema(
+    @maybe_swagger(
         operation_description="Delete user (Admin only)",
         responses={
             204: "User deleted successfully",
@@ -352,3 +399,9 @@ class AdminUserDetailView(generics.RetrieveUpdateDestroyAPIView):
                 'message': 'You cannot delete your own account'
             }, status=status.HTTP_400_BAD_REQUEST)
         return super().delete(request, *args, **kwargs)
+    
+    def perform_destroy(self, instance):
+        user_id = instance.pk
+        super().perform_destroy(instance)
+        # The user's tasks are deleted with them
+        invalidate_stats_cache(user_id)
@@ -9,6 +9,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Response fields checked, in order, for a top-level error message
+_ERROR_FIELDS = ('detail', 'message', 'error', 'non_field_errors')
+
 
 def custom_exception_handler(exc, context):
     """
@@ -29,7 +32,10 @@ def custom_exception_handler(exc, context):
     
     if response is not None:
         # Log the error
-        logger.error(f"API Error: {exc} | View: {context.get('view')} | Request: {context.get('request')}")
+        logger.error(
+            "API Error: %s | View: %s | Request: %s",
+            exc, context.get('view'), context.get('request')
+        )
         
         # Customize the response format
         custom_response_data = {
@@ -66,9 +72,9 @@ def get_error_message(response):
     """Extract a human-readable error message from the response."""
     if isinstance(response.data, dict):
         # Check for common error message fields
-        for field in ['detail', 'message', 'error', 'non_field_errors']:
-            if field in response.data:
-                value = response.data[field]
+        for field in _ERROR_FIELDS:
+            value = response.data.get(field)
+            if value is not None:
                 if isinstance(value, list):
                     return value[0] if value else 'An error occurred'
                 return str(value)
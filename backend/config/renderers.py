@@ -0,0 +1,41 @@
+"""
+Response renderers shared across apps.
+"""
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# DRF's encoder handles the types orjson does not (lazy strings, Decimal, timedelta, ...)
+_fallback_encoder = JSONEncoder()
+
+# Match DRF's output: 'Z' suffix for UTC datetimes, non-string dict keys allowed
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+class OrjsonRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson.
+    
+    Produces the same compact UTF-8 output as DRF's JSONRenderer but encodes
+    in C. Data orjson rejects (e.g. integers beyond 64 bits), indented output
+    and non-default JSON settings are left to the stock renderer. One
+    difference remains: orjson writes NaN/Infinity as null where DRF's strict
+    mode raises; the API itself never renders floats.
+    """
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        # Non-default JSON settings (STRICT/UNICODE/COMPACT_JSON) and indentation use DRF's encoder
+        if (not self.strict or self.ensure_ascii or not self.compact
+                or self.get_indent(accepted_media_type, renderer_context or {})):
+            return super().render(data, accepted_media_type, renderer_context)
+        
+        try:
+            ret = orjson.dumps(data, default=_fallback_encoder.default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        
+        # Escape like DRF: valid JSON, but not valid in JavaScript string literals
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
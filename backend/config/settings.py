@@ -96,9 +96,39 @@ else:
         }
     }
 
+# Cache Configuration
+# Use Redis when REDIS_URL is set, otherwise fall back to local memory
+REDIS_URL = os.getenv('REDIS_URL')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# API Documentation
+# Per-view schema overrides are only attached when docs are enabled
+SWAGGER_ENABLED = os.getenv('SWAGGER_ENABLED', 'True').lower() == 'true'
+
 # Custom User Model
 AUTH_USER_MODEL = 'accounts.User'
 
+# Password hashing
+# bcrypt (12 rounds) for new hashes; existing PBKDF2 hashes are upgraded on next login
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -132,12 +162,19 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # REST Framework Configuration
 REST_FRAMEWORK = {
+    # The user cache is only safe when every worker shares it (see CACHES)
     'DEFAULT_AUTHENTICATION_CLASSES': (
+        'accounts.authentication.CachedJWTAuthentication'
+        if REDIS_URL else
         'rest_framework_simplejwt.authentication.JWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'config.renderers.OrjsonRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 10,
     'EXCEPTION_HANDLER': 'config.exceptions.custom_exception_handler',
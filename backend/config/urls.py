@@ -2,8 +2,15 @@
 URL configuration for PrimeTask API project.
 """
 
+import hashlib
+from functools import wraps
+
 from django.contrib import admin
 from django.urls import path, include, re_path
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from django.views.decorators.gzip import gzip_page
+from django.views.generic import RedirectView
 from rest_framework import permissions
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
@@ -43,6 +50,32 @@ schema_view = get_schema_view(
     permission_classes=(permissions.AllowAny,),
 )
 
+# The schema only changes on deploy, so cache the generated document
+SCHEMA_CACHE_TIMEOUT = 60 * 60
+SCHEMA_CACHE_KWARGS = {'key_prefix': 'primetask-schema-v1'}
+
+
+def schema_etag(view):
+    """
+    Add a content-hash ETag to schema responses and answer matching
+    If-None-Match requests with 304 Not Modified.
+    
+    drf-yasg marks schema responses no-store, which makes Django's
+    conditional_page skip them, so the ETag is computed here instead.
+    """
+    @wraps(view)
+    def wrapped(request, *args, **kwargs):
+        response = view(request, *args, **kwargs)
+        if response.status_code != 200:
+            return response
+        if hasattr(response, 'render') and not response.is_rendered:
+            response.render()
+        etag = quote_etag(hashlib.md5(response.content, usedforsecurity=False).hexdigest())
+        response['ETag'] = etag
+        return get_conditional_response(request, etag=etag, response=response)
+    return wrapped
+
+
 urlpatterns = [
     # Django Admin
     path('admin/', admin.site.urls),
@@ -52,10 +85,25 @@ urlpatterns = [
     path('api/v1/tasks/', include('tasks.urls')),
     
     # Swagger Documentation
-    re_path(r'^swagger(?P<format>\.json|\.yaml)$', schema_view.without_ui(cache_timeout=0), name='schema-json'),
-    path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
-    path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
+    re_path(
+        r'^swagger(?P<format>\.json|\.yaml)$',
+        # ETag/304 for unchanged schemas, gzip for the full download
+        gzip_page(schema_etag(
+            schema_view.without_ui(cache_timeout=SCHEMA_CACHE_TIMEOUT, cache_kwargs=SCHEMA_CACHE_KWARGS)
+        )),
+        name='schema-json',
+    ),
+    path(
+        'swagger/',
+        schema_view.with_ui('swagger', cache_timeout=SCHEMA_CACHE_TIMEOUT, cache_kwargs=SCHEMA_CACHE_KWARGS),
+        name='schema-swagger-ui',
+    ),
+    path(
+        'redoc/',
+        schema_view.with_ui('redoc', cache_timeout=SCHEMA_CACHE_TIMEOUT, cache_kwargs=SCHEMA_CACHE_KWARGS),
+        name='schema-redoc',
+    ),
     
     # Root redirect to swagger
-    path('', schema_view.with_ui('swagger', cache_timeout=0), name='api-root'),
+    path('', RedirectView.as_view(pattern_name='schema-swagger-ui', permanent=False), name='api-root'),
 ]
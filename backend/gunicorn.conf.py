@@ -0,0 +1,21 @@
+"""
+Gunicorn configuration for PrimeTask API.
+
+Loaded automatically when gunicorn is started from the backend directory.
+"""
+
+import os
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:8000')
+
+# Threaded workers: bcrypt releases the GIL while hashing, so login,
+# registration and password changes in one thread no longer block the
+# other requests handled by the same worker.
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+
+# Worker processes stay at gunicorn's default unless explicitly configured
+if os.getenv('GUNICORN_WORKERS'):
+    workers = int(os.environ['GUNICORN_WORKERS'])
+
+timeout = 30
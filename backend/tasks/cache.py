@@ -0,0 +1,33 @@
+"""
+Cache keys and invalidation for task statistics.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+
+# Seconds task statistics stay cached between recomputations
+STATS_CACHE_TIMEOUT = 15
+
+# Admins see system-wide stats, so they share a single entry
+ADMIN_STATS_CACHE_KEY = 'taskstats:admin'
+
+
+def stats_cache_enabled():
+    """
+    Stats are only cached in a shared cache (REDIS_URL), where invalidation
+    reaches every worker; per-process caches would serve stale counts.
+    """
+    return bool(settings.REDIS_URL)
+
+
+def get_stats_cache_key(user):
+    """Build the stats cache key for the given user."""
+    if user.is_admin:
+        return ADMIN_STATS_CACHE_KEY
+    return f'taskstats:{user.pk}:u'
+
+
+def invalidate_stats_cache(*owner_ids):
+    """Drop cached stats for the given task owners and the admin view."""
+    if stats_cache_enabled():
+        cache.delete_many([ADMIN_STATS_CACHE_KEY, *(f'taskstats:{owner_id}:u' for owner_id in owner_ids)])
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-15 21:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['owner', 'status', '-created_at'], name='task_owner_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['owner', '-created_at'], name='task_owner_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['status'], name='task_status_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+"""
+Trigram indexes backing the task search filter on PostgreSQL.
+
+Django compiles ``icontains`` to ``UPPER("col"::text) LIKE UPPER(%s)``, so
+the GIN indexes are built on that same expression. Other databases skip
+this migration. The pg_trgm extension is left installed on reverse.
+"""
+
+from django.db import migrations
+
+SEARCH_INDEXES = {
+    'task_title_trgm': 'title',
+    'task_description_trgm': 'description',
+}
+
+
+def create_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, column in SEARCH_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON tasks '
+            f'USING gin (UPPER({column}::text) gin_trgm_ops)'
+        )
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name in SEARCH_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0002_task_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -6,6 +6,18 @@ from django.db import models
 from django.conf import settings
 
 
+class TaskQuerySet(models.QuerySet):
+    """
+    QuerySet with role-aware visibility helpers.
+    """
+    
+    def for_user(self, user):
+        """Tasks visible to user: all tasks for admins, otherwise their own."""
+        if user.is_authenticated and user.is_admin:
+            return self.all()
+        return self.filter(owner=user)
+
+
 class Task(models.Model):
     """
     Task model for task management system.
@@ -61,11 +73,21 @@ class Task(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = TaskQuerySet.as_manager()
+    
     class Meta:
         db_table = 'tasks'
         verbose_name = 'Task'
         verbose_name_plural = 'Tasks'
         ordering = ['-created_at']
+        indexes = [
+            # Per-user lists filtered by status, newest first
+            models.Index(fields=['owner', 'status', '-created_at'], name='task_owner_status_created_idx'),
+            # Per-user lists, newest first
+            models.Index(fields=['owner', '-created_at'], name='task_owner_created_idx'),
+            # Admin-wide status filters and counts
+            models.Index(fields=['status'], name='task_status_idx'),
+        ]
     
     def __str__(self):
         return f"{self.title} ({self.status})"
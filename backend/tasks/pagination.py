@@ -0,0 +1,18 @@
+"""
+Pagination classes for task endpoints.
+"""
+
+from rest_framework.pagination import CursorPagination
+
+
+class TaskCursorPagination(CursorPagination):
+    """
+    Cursor pagination for task lists, newest first.
+    
+    Cursors seek on created_at instead of using OFFSET, so deep pages cost
+    the same as the first one.
+    """
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+    ordering = '-created_at'
@@ -2,18 +2,180 @@
 Serializers for Task management.
 """
 
+import copy
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models
 from rest_framework import serializers
+from rest_framework.relations import RelatedField
 from .models import Task
 
+# Upper bound on tasks accepted by a single bulk create request
+BULK_CREATE_MAX_TASKS = 1000
+
+# Shared formatter so raw-dict output matches DRF's datetime representation
+_datetime_field = serializers.DateTimeField()
+
+# Choice value -> display label, built once instead of per get_FOO_display() call
+_STATUS_MAP = dict(Task.STATUS_CHOICES)
+_PRIORITY_MAP = dict(Task.PRIORITY_CHOICES)
+
+# Allowed status transitions: current status -> statuses it may move to
+_ALLOWED_TRANSITIONS = {
+    'pending': frozenset(('in_progress', 'cancelled')),
+    'in_progress': frozenset(('completed', 'pending', 'cancelled')),
+    'completed': frozenset(('pending',)),  # Can reopen
+    'cancelled': frozenset(('pending',)),  # Can reopen
+}
+
+
+def serialize_task_row(row):
+    """
+    Build TaskListSerializer's representation from a values() row.
+    
+    Expects the keys of tasks.views.TASK_LIST_FIELDS plus '_owner_username'.
+    """
+    return {
+        'id': row['id'],
+        'title': row['title'],
+        'status': row['status'],
+        'priority': row['priority'],
+        'due_date': _datetime_field.to_representation(row['due_date']),
+        'owner_username': row['_owner_username'],
+        'created_at': _datetime_field.to_representation(row['created_at']),
+    }
+
+
+# Fields whose to_representation returns model attribute values unchanged
+_PASSTHROUGH_FIELDS = (serializers.IntegerField, serializers.CharField, serializers.ChoiceField)
+
+
+def compile_representation(serializer_class):
+    """
+    Compile a serializer's output into a function returning one dict literal.
+    
+    Each readable field becomes a direct attribute read on the instance,
+    or a call to its own get_attribute() where the field overrides it;
+    fields that transform their value keep their own to_representation.
+    """
+    namespace = {}
+    items = []
+    for index, field in enumerate(serializer_class()._readable_fields):
+        if field.source == '*' or isinstance(field, RelatedField):
+            raise ImproperlyConfigured(
+                f"Cannot compile field '{field.field_name}' of {serializer_class.__name__}."
+            )
+        if type(field).get_attribute is not serializers.Field.get_attribute:
+            namespace[f'_get{index}'] = field.get_attribute
+            value = f'_get{index}(inst)'
+        else:
+            value = 'inst.' + '.'.join(field.source_attrs)
+        if isinstance(field, serializers.DateTimeField):
+            # DateTimeField already maps None to None
+            namespace[f'_rep{index}'] = field.to_representation
+            value = f'_rep{index}({value})'
+        elif not isinstance(field, _PASSTHROUGH_FIELDS):
+            namespace[f'_rep{index}'] = field.to_representation
+            value = f'(None if (_v{index} := {value}) is None else _rep{index}(_v{index}))'
+        items.append(f'{field.field_name!r}: {value}')
+    
+    source = 'def to_representation(inst):\n    return {%s}\n' % ', '.join(items)
+    exec(compile(source, f'<{serializer_class.__name__}.to_representation>', 'exec'), namespace)
+    return namespace['to_representation']
+
+
+class OwnerAttributeMixin:
+    """
+    Read-only owner attribute taken from the view's ``_owner_<attr>`` annotation.
+    
+    Instances from querysets without the annotation fall back to the related
+    owner, which costs one query per task unless it was select_related.
+    """
+    
+    def __init__(self, owner_attr, **kwargs):
+        self.owner_attr = owner_attr
+        kwargs['source'] = f'_owner_{owner_attr}'
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+    
+    def get_attribute(self, instance):
+        try:
+            return getattr(instance, self.source)
+        except AttributeError:
+            return getattr(instance.owner, self.owner_attr)
+
+
+class OwnerCharField(OwnerAttributeMixin, serializers.CharField):
+    pass
+
+
+class OwnerEmailField(OwnerAttributeMixin, serializers.EmailField):
+    pass
+
+
+class ChoiceDisplayField(serializers.ReadOnlyField):
+    """
+    Read-only field rendering a choice value as its display label.
+    """
+    
+    def __init__(self, choice_map, **kwargs):
+        self.choice_map = choice_map
+        super().__init__(**kwargs)
+    
+    def to_representation(self, value):
+        return self.choice_map.get(value, value)
+
+
+def serialize_task(task):
+    """
+    Build TaskSerializer's representation of a task as a plain dict.
+    
+    Used on write paths where the task and its owner are already in memory,
+    avoiding a second serializer instantiation.
+    """
+    owner = task.owner
+    return {
+        'id': task.id,
+        'title': task.title,
+        'description': task.description,
+        'status': task.status,
+        'status_display': _STATUS_MAP.get(task.status, task.status),
+        'priority': task.priority,
+        'priority_display': _PRIORITY_MAP.get(task.priority, task.priority),
+        'due_date': _datetime_field.to_representation(task.due_date),
+        'owner': task.owner_id,
+        'owner_email': owner.email,
+        'owner_username': owner.username,
+        'created_at': _datetime_field.to_representation(task.created_at),
+        'updated_at': _datetime_field.to_representation(task.updated_at),
+    }
+
+
+class CachedFieldsMixin:
+    """
+    Build a ModelSerializer's fields once per class.
+    
+    ModelSerializer.get_fields() deep-copies the declared fields and
+    introspects the model on every instantiation. The result is cached on
+    the concrete class, and each instance receives shallow copies so that
+    binding a field to its parent never touches the shared templates.
+    """
+    
+    def get_fields(self):
+        cls = type(self)
+        if '_cached_fields' not in cls.__dict__:
+            cls._cached_fields = super().get_fields()
+        return {name: copy.copy(field) for name, field in cls._cached_fields.items()}
+
 
-class TaskSerializer(serializers.ModelSerializer):
+class TaskSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for Task CRUD operations.
     """
-    owner_email = serializers.EmailField(source='owner.email', read_only=True)
-    owner_username = serializers.CharField(source='owner.username', read_only=True)
-    status_display = serializers.CharField(source='get_status_display', read_only=True)
-    priority_display = serializers.CharField(source='get_priority_display', read_only=True)
+    owner_email = OwnerEmailField('email')
+    owner_username = OwnerCharField('username')
+    status_display = ChoiceDisplayField(_STATUS_MAP, source='status')
+    priority_display = ChoiceDisplayField(_PRIORITY_MAP, source='priority')
     
     class Meta:
         model = Task
@@ -46,21 +208,24 @@ class TaskSerializer(serializers.ModelSerializer):
         """Validate status transitions."""
         if self.instance:  # Update operation
             current_status = self.instance.status
-            # Define allowed transitions
-            allowed_transitions = {
-                'pending': ['in_progress', 'cancelled'],
-                'in_progress': ['completed', 'pending', 'cancelled'],
-                'completed': ['pending'],  # Can reopen
-                'cancelled': ['pending'],  # Can reopen
-            }
-            if value != current_status and value not in allowed_transitions.get(current_status, []):
+            if value != current_status and value not in _ALLOWED_TRANSITIONS.get(current_status, ()):
                 raise serializers.ValidationError(
                     f"Cannot transition from '{current_status}' to '{value}'."
                 )
         return value
+    
+    def update(self, instance, validated_data):
+        """Write only the submitted columns on partial updates."""
+        if not self.partial:
+            return super().update(instance, validated_data)
+        
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=[*validated_data, 'updated_at'])
+        return instance
 
 
-class TaskCreateSerializer(serializers.ModelSerializer):
+class TaskCreateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for creating tasks.
     """
@@ -83,11 +248,34 @@ class TaskCreateSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class TaskListSerializer(serializers.ModelSerializer):
+class TaskBulkCreateSerializer(serializers.Serializer):
+    """
+    Serializer for validating a batch of tasks to be created together.
+    
+    Each entry is validated with TaskCreateSerializer; saving is left to
+    the view so the batch can be inserted with bulk_create.
+    """
+    tasks = TaskCreateSerializer(many=True, allow_empty=False, max_length=BULK_CREATE_MAX_TASKS)
+
+
+class TaskListListSerializer(serializers.ListSerializer):
+    """
+    List serializer that calls the child's compiled representation directly.
+    
+    Skips the per-item bound method dispatch through child.to_representation().
+    """
+    
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        compiled = self.child._compiled_representation
+        return [compiled(item) for item in iterable]
+
+
+class TaskListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Lightweight serializer for listing tasks.
     """
-    owner_username = serializers.CharField(source='owner.username', read_only=True)
+    owner_username = OwnerCharField('username')
     
     class Meta:
         model = Task
@@ -100,6 +288,14 @@ class TaskListSerializer(serializers.ModelSerializer):
             'owner_username',
             'created_at',
         ]
+        list_serializer_class = TaskListListSerializer
+    
+    def to_representation(self, instance):
+        return self._compiled_representation(instance)
+
+
+# Fixed output shape: render rows with one dict literal instead of a field loop
+TaskListSerializer._compiled_representation = staticmethod(compile_representation(TaskListSerializer))
 
 
 class TaskStatsSerializer(serializers.Serializer):
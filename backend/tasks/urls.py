@@ -5,9 +5,11 @@ URL patterns for task management endpoints.
 from django.urls import path
 from .views import (
     TaskListCreateView,
+    BulkTaskCreateView,
     TaskDetailView,
     TaskStatsView,
     AdminTaskListView,
+    AdminTaskExportView,
     AdminTaskDeleteView,
 )
 
@@ -16,10 +18,12 @@ app_name = 'tasks'
 urlpatterns = [
     # Task CRUD endpoints
     path('', TaskListCreateView.as_view(), name='task_list_create'),
+    path('bulk/', BulkTaskCreateView.as_view(), name='task_bulk_create'),
     path('<int:pk>/', TaskDetailView.as_view(), name='task_detail'),
     path('stats/', TaskStatsView.as_view(), name='task_stats'),
     
     # Admin endpoints
     path('admin/all/', AdminTaskListView.as_view(), name='admin_task_list'),
+    path('admin/export/', AdminTaskExportView.as_view(), name='admin_task_export'),
     path('admin/<int:pk>/delete/', AdminTaskDeleteView.as_view(), name='admin_task_delete'),
 ]
@@ -5,18 +5,56 @@ Views for Task management.
 from rest_framework import generics, status, views
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from django.db.models import Count, Q
-from drf_yasg.utils import swagger_auto_schema
+from django.core.cache import cache
+from django.db.models import Count, F, Q
+from django.http import StreamingHttpResponse
 from drf_yasg import openapi
 
 from .models import Task
 from .serializers import (
     TaskSerializer,
     TaskCreateSerializer,
+    TaskBulkCreateSerializer,
     TaskListSerializer,
     TaskStatsSerializer,
+    serialize_task,
+    serialize_task_row,
 )
 from accounts.permissions import IsOwnerOrAdmin, IsAdminUser
+from config.renderers import OrjsonRenderer
+from config.swagger import maybe_swagger
+from .pagination import TaskCursorPagination
+from .cache import (
+    STATS_CACHE_TIMEOUT,
+    get_stats_cache_key,
+    invalidate_stats_cache,
+    stats_cache_enabled,
+)
+
+# Columns read by TaskListSerializer; leaves the description TEXT column unloaded
+TASK_LIST_FIELDS = ('id', 'title', 'status', 'priority', 'due_date', 'created_at')
+
+# Owner columns joined onto task rows, read by the serializers as plain attributes
+OWNER_USERNAME = {'_owner_username': F('owner__username')}
+OWNER_FIELDS = {**OWNER_USERNAME, '_owner_email': F('owner__email')}
+
+# Rows per INSERT statement for bulk task creation
+BULK_CREATE_BATCH_SIZE = 500
+
+# Rows fetched per database round-trip when streaming exports
+EXPORT_CHUNK_SIZE = 500
+
+
+def stream_json_array(rows):
+    """Yield task rows as a JSON array, one encoded item at a time."""
+    # Same encoding as every other API response
+    render = OrjsonRenderer().render
+    yield b'['
+    for index, row in enumerate(rows):
+        if index:
+            yield b','
+        yield render(serialize_task_row(row))
+    yield b']'
 
 
 class TaskListCreateView(generics.ListCreateAPIView):
@@ -27,6 +65,7 @@ class TaskListCreateView(generics.ListCreateAPIView):
     - Admin users: See all tasks
     """
     permission_classes = [IsAuthenticated]
+    pagination_class = TaskCursorPagination
     
     def get_serializer_class(self):
         if self.request.method == 'POST':
@@ -41,31 +80,49 @@ class TaskListCreateView(generics.ListCreateAPIView):
         if getattr(self, 'swagger_fake_view', False):
             return Task.objects.none()
         
-        user = self.request.user
-        
         # Admin sees all tasks, regular users see only their own
-        if user.is_authenticated and hasattr(user, 'role') and user.role == 'admin':
-            queryset = Task.objects.all()
-        else:
-            queryset = Task.objects.filter(owner=user)
+        queryset = Task.objects.for_user(self.request.user)
+        
+        # Only load the columns TaskListSerializer renders
+        queryset = queryset.only(*TASK_LIST_FIELDS).annotate(**OWNER_USERNAME)
         
         # Apply filters
-        status_filter = self.request.query_params.get('status')
-        priority_filter = self.request.query_params.get('priority')
-        search = self.request.query_params.get('search')
+        query_params = self.request.query_params
+        status_filter = query_params.get('status')
+        priority_filter = query_params.get('priority')
+        search = query_params.get('search')
         
+        if not (status_filter or priority_filter or search):
+            return queryset
+        
+        # Combine all filters into a single filter() call
+        conditions = Q()
         if status_filter:
-            queryset = queryset.filter(status=status_filter)
+            conditions &= Q(status=status_filter)
         if priority_filter:
-            queryset = queryset.filter(priority=priority_filter)
+            conditions &= Q(priority=priority_filter)
         if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) | Q(description__icontains=search)
-            )
+            conditions &= Q(title__icontains=search) | Q(description__icontains=search)
         
-        return queryset
+        return queryset.filter(conditions)
     
-    @swagger_auto_schema(
+    def list(self, request, *args, **kwargs):
+        """
+        Serve list pages from values() rows instead of TaskListSerializer.
+        
+        The list is read-only, so plain dicts skip model instantiation and
+        serializer field machinery while producing the same output.
+        """
+        queryset = self.filter_queryset(self.get_queryset()).values(*TASK_LIST_FIELDS, *OWNER_USERNAME)
+        page = self.paginate_queryset(queryset)
+        rows = page if page is not None else queryset
+        data = [serialize_task_row(row) for row in rows]
+        
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
+    
+    @maybe_swagger(
         operation_description="List all tasks (filtered by role)",
         manual_parameters=[
             openapi.Parameter(
@@ -94,7 +151,7 @@ class TaskListCreateView(generics.ListCreateAPIView):
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
     
-    @swagger_auto_schema(
+    @maybe_swagger(
         operation_description="Create a new task",
         request_body=TaskCreateSerializer,
         responses={
@@ -106,10 +163,11 @@ class TaskListCreateView(generics.ListCreateAPIView):
         serializer = self.get_serializer(data=request.data)
         if serializer.is_valid():
             task = serializer.save()
+            invalidate_stats_cache(task.owner_id)
             return Response({
                 'success': True,
                 'message': 'Task created successfully',
-                'data': TaskSerializer(task).data
+                'data': serialize_task(task)
             }, status=status.HTTP_201_CREATED)
         
         return Response({
@@ -119,6 +177,46 @@ class TaskListCreateView(generics.ListCreateAPIView):
         }, status=status.HTTP_400_BAD_REQUEST)
 
 
+class BulkTaskCreateView(views.APIView):
+    """
+    Create many tasks for the current user in one request.
+    
+    Entries are validated individually, then inserted with bulk_create
+    instead of one INSERT per task.
+    """
+    permission_classes = [IsAuthenticated]
+    
+    @maybe_swagger(
+        operation_description="Create multiple tasks at once",
+        request_body=TaskBulkCreateSerializer,
+        responses={
+            201: TaskSerializer(many=True),
+            400: "Bad Request - Validation errors"
+        }
+    )
+    def post(self, request):
+        serializer = TaskBulkCreateSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response({
+                'success': False,
+                'message': 'Task creation failed',
+                'errors': serializer.errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        user = request.user
+        tasks = Task.objects.bulk_create(
+            [Task(owner=user, **item) for item in serializer.validated_data['tasks']],
+            batch_size=BULK_CREATE_BATCH_SIZE,
+        )
+        invalidate_stats_cache(user.pk)
+        
+        return Response({
+            'success': True,
+            'message': f'{len(tasks)} tasks created successfully',
+            'data': [serialize_task(task) for task in tasks]
+        }, status=status.HTTP_201_CREATED)
+
+
 class TaskDetailView(generics.RetrieveUpdateDestroyAPIView):
     """
     Retrieve, update, or delete a specific task.
@@ -135,12 +233,9 @@ class TaskDetailView(generics.RetrieveUpdateDestroyAPIView):
         if getattr(self, 'swagger_fake_view', False):
             return Task.objects.none()
         
-        user = self.request.user
-        if user.is_authenticated and hasattr(user, 'role') and user.role == 'admin':
-            return Task.objects.all()
-        return Task.objects.filter(owner=user)
+        return Task.objects.for_user(self.request.user).annotate(**OWNER_FIELDS)
     
-    @swagger_auto_schema(
+    @maybe_swagger(
         operation_description="Get task details",
         responses={
             200: TaskSerializer,
@@ -150,7 +245,7 @@ class TaskDetailView(generics.RetrieveUpdateDestroyAPIView):
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
     
-    @swagger_auto_schema(
+    @maybe_swagger(
         operation_description="Update task (full update)",
         request_body=TaskSerializer,
         responses={
@@ -162,7 +257,7 @@ class TaskDetailView(generics.RetrieveUpdateDestroyAPIView):
     def put(self, request, *args, **kwargs):
         return super().put(request, *args, **kwargs)
     
-    @swagger_auto_schema(
+    @maybe_swagger(
         operation_description="Update task (partial update)",
         request_body=TaskSerializer,
         responses={
@@ -174,7 +269,7 @@ class TaskDetailView(generics.RetrieveUpdateDestroyAPIView):
     def patch(self, request, *args, **kwargs):
         return super().patch(request, *args, **kwargs)
     
-    @swagger_auto_schema(
+    @maybe_swagger(
         operation_description="Delete task",
         responses={
             204: "Task deleted successfully",
@@ -183,6 +278,14 @@ class TaskDetailView(generics.RetrieveUpdateDestroyAPIView):
     )
     def delete(self, request, *args, **kwargs):
         return super().delete(request, *args, **kwargs)
+    
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        invalidate_stats_cache(serializer.instance.owner_id)
+    
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        invalidate_stats_cache(instance.owner_id)
 
 
 class TaskStatsView(views.APIView):
@@ -194,29 +297,31 @@ class TaskStatsView(views.APIView):
     """
     permission_classes = [IsAuthenticated]
     
-    @swagger_auto_schema(
+    @maybe_swagger(
         operation_description="Get task statistics",
         responses={
             200: TaskStatsSerializer
         }
     )
     def get(self, request):
-        user = request.user
-        
-        # Filter based on role
-        if user.is_authenticated and hasattr(user, 'role') and user.role == 'admin':
-            queryset = Task.objects.all()
-        else:
-            queryset = Task.objects.filter(owner=user)
+        # Dashboards poll stats; serve them from a short-lived shared cache
+        cache_key = get_stats_cache_key(request.user) if stats_cache_enabled() else None
+        stats = cache.get(cache_key) if cache_key else None
         
-        # Calculate statistics
-        stats = {
-            'total': queryset.count(),
-            'pending': queryset.filter(status='pending').count(),
-            'in_progress': queryset.filter(status='in_progress').count(),
-            'completed': queryset.filter(status='completed').count(),
-            'cancelled': queryset.filter(status='cancelled').count(),
-        }
+        if stats is None:
+            # Filter based on role
+            queryset = Task.objects.for_user(request.user)
+            
+            # Calculate statistics in a single aggregate query
+            stats = queryset.aggregate(
+                total=Count('id'),
+                pending=Count('id', filter=Q(status='pending')),
+                in_progress=Count('id', filter=Q(status='in_progress')),
+                completed=Count('id', filter=Q(status='completed')),
+                cancelled=Count('id', filter=Q(status='cancelled')),
+            )
+            if cache_key:
+                cache.set(cache_key, stats, STATS_CACHE_TIMEOUT)
         
         return Response({
             'success': True,
@@ -229,11 +334,12 @@ class AdminTaskListView(generics.ListAPIView):
     """
     List all tasks in the system (Admin only).
     """
-    queryset = Task.objects.all()
+    queryset = Task.objects.only(*TASK_LIST_FIELDS).annotate(**OWNER_USERNAME)
     permission_classes = [IsAuthenticated, IsAdminUser]
     serializer_class = TaskListSerializer
+    pagination_class = TaskCursorPagination
     
-    @swagger_auto_schema(
+    @maybe_swagger(
         operation_description="List all tasks (Admin only)",
         responses={
             200: TaskListSerializer(many=True),
@@ -244,6 +350,32 @@ class AdminTaskListView(generics.ListAPIView):
         return super().get(request, *args, **kwargs)
 
 
+class AdminTaskExportView(views.APIView):
+    """
+    Export every task in the system as a single JSON array (Admin only).
+    
+    Rows are read with a chunked iterator and streamed as they are encoded,
+    so memory stays bounded regardless of table size.
+    """
+    permission_classes = [IsAuthenticated, IsAdminUser]
+    
+    @maybe_swagger(
+        operation_description="Export all tasks as a streamed JSON array (Admin only)",
+        responses={
+            200: TaskListSerializer(many=True),
+            403: "Forbidden - Admin access required"
+        }
+    )
+    def get(self, request):
+        rows = (
+            Task.objects
+            .annotate(**OWNER_USERNAME)
+            .values(*TASK_LIST_FIELDS, *OWNER_USERNAME)
+            .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        )
+        return StreamingHttpResponse(stream_json_array(rows), content_type='application/json')
+
+
 class AdminTaskDeleteView(generics.DestroyAPIView):
     """
     Delete any task (Admin only).
@@ -251,7 +383,7 @@ class AdminTaskDeleteView(generics.DestroyAPIView):
     queryset = Task.objects.all()
     permission_classes = [IsAuthenticated, IsAdminUser]
     
-    @swagger_auto_schema(
+    @maybe_swagger(
         operation_description="Delete any task (Admin only)",
         responses={
             204: "Task deleted successfully",
@@ -262,6 +394,7 @@ class AdminTaskDeleteView(generics.DestroyAPIView):
     def delete(self, request, *args, **kwargs):
         task = self.get_object()
         task.delete()
+        invalidate_stats_cache(task.owner_id)
         return Response({
             'success': True,
             'message': 'Task deleted successfully'